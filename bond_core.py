@@ -0,0 +1,110 @@
+import math
+import numpy as np
+try:
+    from numba import njit, prange # Compiles the numeric pricing core to machine code
+    HAVE_NUMBA = True
+except ImportError:
+    # Numba is optional: without it the kernels below run as plain Python.
+    # Callers that price whole arrays check HAVE_NUMBA and use price_numpy instead.
+    HAVE_NUMBA = False
+    def njit(**options):
+        return lambda func: func
+    prange = range
+
+# --- Shared Numeric Pricing Kernels ---
+# Used by both the CLI (bond_pricer.py) and the Streamlit dashboard (bond_dashboard.py),
+# so the pricing formula lives in one place and is compiled once.
+#
+# Callers validate their inputs and turn dates and coupon frequency into per-period terms:
+#   num_periods          = total coupon periods remaining (int)
+#   periodic_coupon_rate = annual coupon rate / coupon frequency
+#   periodic_ytm         = annual YTM / coupon frequency
+
+@njit(cache=True, fastmath=True, inline='always')
+def price(face_value, periodic_coupon_rate, num_periods, periodic_ytm):
+    """
+    Prices a single bond from already-validated per-period inputs.
+    Inlined into compiled callers, so it can be specialized on their constants.
+    """
+    # Handle cases where the bond is very close to maturity or already matured
+    if num_periods <= 0:
+        # If the bond matures today or very soon, its price is essentially face value.
+        # For simplicity, we return face value here. Real-world would involve accrued interest.
+        return face_value
+
+    # Calculate the periodic coupon payment
+    # This is the amount paid out each time a coupon is due.
+    periodic_coupon_payment = face_value * periodic_coupon_rate
+
+    # Fast path for very long schedules: the closed-form annuity in a single exp/log1p.
+    # Writing (1 + r)^-n as exp(x) with x = -n * log1p(r) keeps 1 - (1 + r)^-n = -expm1(x)
+    # accurate for small yields, and the annuity factor -expm1(x) / r tends to n as r -> 0,
+    # so only the exact-zero point needs substituting rather than a separate zero-yield branch.
+    if num_periods > 10000:
+        x = -num_periods * math.log1p(periodic_ytm)
+        annuity_factor = num_periods if abs(x) < 1e-12 else -math.expm1(x) / periodic_ytm
+        return periodic_coupon_payment * annuity_factor + face_value * math.exp(x)
+
+    # Roll the cash flows back from maturity to today, one period at a time:
+    #   PV_k = (C + PV_{k+1}) / (1 + r), starting from PV_n = FV
+    # Unlike 1 - (1 + r)^-n, this doesn't lose precision for small yields. A zero yield
+    # runs through the same loop, so its price (face value plus every coupon) can carry
+    # a few ulps of rounding rather than being exact; callers compare prices at cents.
+    one_period_discount = 1.0 / (1.0 + periodic_ytm)
+    bond_price = face_value
+    for _ in range(num_periods):
+        bond_price = (bond_price + periodic_coupon_payment) * one_period_discount
+
+    return bond_price
+
+@njit(cache=True, fastmath=True, inline='always')
+def price_f32(face_value, periodic_coupon_rate, num_periods, periodic_ytm):
+    """
+    float32 variant of price() for plots, where a few significant digits are enough
+    and twice as many values fit per SIMD register. Always uses the closed-form
+    annuity via log1p/expm1, because the period-by-period recurrence would
+    accumulate float32 rounding error. Agrees with price() to within 1e-5
+    relative to the price (see test_bond_core.py).
+    """
+    fv = np.float32(face_value)
+    coupon = np.float32(face_value * periodic_coupon_rate)
+    n = np.float32(max(num_periods, 0))
+    r = np.float32(periodic_ytm)
+    x = -n * math.log1p(r)
+    annuity_factor = n if x == 0 else -math.expm1(x) / r
+    return coupon * annuity_factor + fv * math.exp(x)
+
+@njit(cache=True, parallel=True)
+def price_vec(face_values, periodic_coupon_rates, num_periods, periodic_ytms):
+    """
+    Prices a batch of bonds element-wise, spreading the bonds across cores.
+    All arguments are equal-length arrays of already-validated per-period inputs.
+    """
+    prices = np.empty(face_values.shape[0])
+    for i in prange(face_values.shape[0]):
+        prices[i] = price(face_values[i], periodic_coupon_rates[i], num_periods[i], periodic_ytms[i])
+    return prices
+
+def price_numpy(face_value, periodic_coupon_rate, num_periods, periodic_ytms):
+    """
+    Prices one bond across an array of per-period yields using only NumPy ufuncs,
+    for when Numba isn't installed (the dashboard sweep and bond_pricer_vectorized). This is the same
+    closed form as price()'s long-schedule fast path rather than the recurrence,
+    so results can differ from price() in the last few digits.
+    """
+    periodic_ytms = np.asarray(periodic_ytms, dtype=np.float64)
+
+    if num_periods <= 0:
+        # Bond matures within the current period: priced at face value, as in price()
+        return np.full(periodic_ytms.shape, float(face_value))
+
+    periodic_coupon_payment = face_value * periodic_coupon_rate
+
+    x = -num_periods * np.log1p(periodic_ytms)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        annuity_factor = np.where(x == 0, num_periods, -np.expm1(x) / periodic_ytms)
+
+    return periodic_coupon_payment * annuity_factor + face_value * np.exp(x)
+
+# Warm up the compiled kernel at import so the first call doesn't pay JIT latency
+price(1000.0, 0.025, 10, 0.02)
@@ -1,9 +1,19 @@
 import streamlit as st
-import pandas as pd
 from datetime import datetime, date
-import plotly.graph_objects as go
-import plotly.express as px
 import numpy as np # For numerical operations, especially for generating YTM ranges
+import math
+import bond_core # Shared compiled pricing kernels
+from bond_core import njit # Numba's, or a no-op stand-in when it isn't installed
+
+# Coupon frequency choices offered in the sidebar (label -> payments per year).
+# Built once at import rather than on every Streamlit rerun.
+_FREQ_OPTIONS = {
+    "Annual (1x)": 1,
+    "Semi-Annual (2x)": 2,
+    "Quarterly (4x)": 4,
+    "Monthly (12x)": 12
+}
+_FREQ_LABELS = tuple(_FREQ_OPTIONS)
 
 # --- 1. Bond Pricing Theory Explained (for reference in comments) ---
 # A bond's price is the present value of its future cash flows.
@@ -25,7 +35,7 @@ import numpy as np # For numerical operations, especially for generating YTM ran
 #   n = Total Number of Periods until Maturity (Years to Maturity * Coupon Frequency)
 
 # --- 2. Core Calculation Function ---
-def calculate_bond_price(face_value, coupon_rate, maturity_date, ytm, coupon_frequency_per_year):
+def calculate_bond_price(face_value, coupon_rate, maturity_date, ytm, coupon_frequency_per_year, num_periods=None):
     """
     Calculates the price of a bond based on its characteristics.
     Adjusted for Streamlit to take datetime.date objects directly for maturity_date.
@@ -36,6 +46,8 @@ def calculate_bond_price(face_value, coupon_rate, maturity_date, ytm, coupon_fre
         maturity_date (datetime.date): The bond's maturity date.
         ytm (float): The annual Yield to Maturity as a decimal (e.g., 0.04).
         coupon_frequency_per_year (int): How many times the coupon is paid per year.
+        num_periods (int, optional): Coupon periods remaining, if the caller already resolved
+                                     them with _resolve_periods; resolved here otherwise.
 
     Returns:
         float: The calculated present value (price) of the bond.
@@ -53,36 +65,88 @@ def calculate_bond_price(face_value, coupon_rate, maturity_date, ytm, coupon_fre
         st.error("Error: Coupon frequency must be a positive integer.")
         return None
 
-    # Calculate years remaining until maturity
-    years_to_maturity = (maturity_date - today).days / 365.25 # Approximate
+    if num_periods is None:
+        num_periods = _resolve_periods(maturity_date, coupon_frequency_per_year)
 
-    # Calculate the total number of coupon periods remaining
-    num_periods = np.ceil(years_to_maturity * coupon_frequency_per_year)
+    return _price(face_value, coupon_rate, num_periods, ytm, coupon_frequency_per_year)
 
-    if num_periods <= 0:
-        # If the bond matures very soon (within the current period), its price is essentially face value.
-        # For simplicity, we return face value here. Real-world would involve accrued interest.
-        return face_value
+def _resolve_periods(maturity_date, freq):
+    """
+    Number of coupon periods remaining until maturity_date.
+    Only depends on the date and frequency, so it is resolved once per rerun
+    rather than once per priced yield.
+    """
+    # Calculate years remaining until maturity
+    years_to_maturity = (maturity_date - date.today()).days / 365.25 # Approximate
 
-    # Calculate the periodic coupon payment
-    periodic_coupon_payment = (face_value * coupon_rate) / coupon_frequency_per_year
+    # Calculate the total number of coupon periods remaining
+    return math.ceil(years_to_maturity * freq)
 
-    # Calculate the periodic yield to maturity
-    periodic_ytm = ytm / coupon_frequency_per_year
+# Streamlit re-runs the whole script on every widget change, so the pure pricing
+# functions below are cached on their arguments. They must stay free of st.* calls;
+# validation and error display belong to the callers.
+@st.cache_data(max_entries=512)
+def _price(face_value, coupon_rate, num_periods, ytm, freq):
+    """
+    Prices a validated bond. Cached across Streamlit reruns.
+    """
+    price_fixed, _ = _pricers_for(int(freq))
+    return price_fixed(float(face_value), float(coupon_rate), int(num_periods), float(ytm))
 
-    # Calculate the Present Value (PV) of all future coupon payments (annuity)
-    pv_coupons = 0.0
-    if periodic_ytm == 0:
-        pv_coupons = periodic_coupon_payment * num_periods
-    else:
-        pv_coupons = periodic_coupon_payment * ((1 - (1 + periodic_ytm)**(-num_periods)) / periodic_ytm)
+@st.cache_data(max_entries=512)
+def _price_sweep(face_value, coupon_rate, num_periods, ytm_arr, freq):
+    """
+    Prices a validated bond across an array of annual YTMs, in float32 for the chart.
+    Cached across Streamlit reruns.
+    Without Numba, the compiled loop below would run as plain Python, one yield at a time,
+    so the sweep is priced with NumPy array operations instead (in float64).
+    """
+    if not bond_core.HAVE_NUMBA:
+        return bond_core.price_numpy(float(face_value), float(coupon_rate) / freq, int(num_periods),
+                                     np.asarray(ytm_arr, dtype=np.float64) / freq)
 
-    # Calculate the Present Value (PV) of the bond's face value (principal)
-    pv_face_value = face_value / ((1 + periodic_ytm)**num_periods)
+    _, price_fixed_vec = _pricers_for(int(freq))
+    return price_fixed_vec(float(face_value), float(coupon_rate), int(num_periods),
+                           np.asarray(ytm_arr, dtype=np.float32))
 
-    bond_price = pv_coupons + pv_face_value
+def _make_pricer(freq):
+    """
+    Builds a (scalar, sweep) pair of compiled pricers for one coupon frequency.
+    freq is captured by the closures, so Numba treats it as a compile-time constant
+    and can fold the divisions by it instead of doing them at runtime.
+    """
+    @njit(cache=True, fastmath=True)
+    def _price_fixed(face_value, coupon_rate, num_periods, ytm):
+        return bond_core.price(face_value, coupon_rate / freq, num_periods, ytm / freq)
+
+    # Deliberately single-threaded: Streamlit runs each session in its own thread, and
+    # Numba's parallel threading layers don't tolerate concurrent launches from several
+    # threads. Fifty yields gain nothing from a thread pool anyway.
+    @njit(cache=True, fastmath=True)
+    def _price_fixed_vec(face_value, coupon_rate, num_periods, ytm_arr):
+        # Prices the same bond across a float32 array of annual YTMs (used by the sensitivity chart)
+        prices = np.empty(ytm_arr.shape[0], dtype=np.float32)
+        for i in range(ytm_arr.shape[0]):
+            prices[i] = bond_core.price_f32(face_value, coupon_rate / freq, num_periods,
+                                            ytm_arr[i] / np.float32(freq))
+        return prices
+
+    return _price_fixed, _price_fixed_vec
+
+def _pricers_for(freq):
+    """
+    Specialized pricers for freq, built on first use for frequencies outside the sidebar options.
+    """
+    if freq not in _PRICERS:
+        _PRICERS[freq] = _make_pricer(freq)
+    return _PRICERS[freq]
 
-    return bond_price
+# One specialization per sidebar frequency, warmed up at import so the first
+# user interaction doesn't pay JIT latency
+_PRICERS = {freq: _make_pricer(freq) for freq in _FREQ_OPTIONS.values()}
+for _scalar_pricer, _sweep_pricer in _PRICERS.values():
+    _scalar_pricer(1000.0, 0.05, 10, 0.04)
+    _sweep_pricer(1000.0, 0.05, 10, np.array([0.03, 0.04], dtype=np.float32))
 
 # --- 3. Streamlit Application Layout ---
 def main():
@@ -139,34 +203,36 @@ def main():
     )
     ytm = ytm_percent / 100.0 # Convert to decimal for calculation
 
-    coupon_frequency_options = {
-        "Annual (1x)": 1,
-        "Semi-Annual (2x)": 2,
-        "Quarterly (4x)": 4,
-        "Monthly (12x)": 12
-    }
     selected_frequency_label = st.sidebar.selectbox(
         "Coupon Frequency per Year",
-        options=list(coupon_frequency_options.keys()),
+        options=_FREQ_LABELS,
         index=1, # Default to Semi-Annual
         help="How many times per year the bond pays interest."
     )
-    coupon_frequency = coupon_frequency_options[selected_frequency_label]
+    coupon_frequency = _FREQ_OPTIONS[selected_frequency_label]
 
 
     # --- Main Content Area for Results and Charts ---
     st.header("Bond Price Calculation")
 
+    # Resolve the number of coupon periods once per rerun; the headline price and the
+    # sensitivity chart below both use it, so they always agree on the period count
+    num_periods = _resolve_periods(maturity_date, coupon_frequency)
+
     # Calculate and display the bond price
-    bond_price = calculate_bond_price(face_value, coupon_rate, maturity_date, ytm, coupon_frequency)
+    bond_price = calculate_bond_price(face_value, coupon_rate, maturity_date, ytm, coupon_frequency,
+                                      num_periods=num_periods)
 
     if bond_price is not None:
         st.success(f"**Calculated Bond Price:** **${bond_price:,.2f}**")
 
         # Display bond status (premium, discount, par)
-        if bond_price > face_value:
+        # Compare at the displayed precision (cents), so floating-point noise in the
+        # price can't label a "$1,000.00" bond with a $1,000 face value as a premium.
+        rounded_price = round(bond_price, 2)
+        if rounded_price > round(face_value, 2):
             st.info(f"This is a **Premium Bond** (Price > Face Value)")
-        elif bond_price < face_value:
+        elif rounded_price < round(face_value, 2):
             st.warning(f"This is a **Discount Bond** (Price < Face Value)")
         else:
             st.info(f"This is a **Par Bond** (Price = Face Value)")
@@ -181,46 +247,40 @@ def main():
         ytm_range = np.linspace(max(0.0, ytm_percent - 5), ytm_percent + 5, 50) # YTM from current -5% to +5%
         ytm_range = np.round(ytm_range, 1) # Round to 1 decimal for cleaner display
 
-        # Calculate bond prices for the YTM range
-        prices_for_ytm_range = []
-        for y in ytm_range:
-            price = calculate_bond_price(face_value, coupon_rate, maturity_date, y / 100.0, coupon_frequency)
-            if price is not None:
-                prices_for_ytm_range.append(price)
-            else:
-                prices_for_ytm_range.append(np.nan) # Handle cases where calculation might fail for an extreme YTM
-
-        # Create a DataFrame for Plotly
-        df_price_sensitivity = pd.DataFrame({
-            'YTM (%)': ytm_range,
-            'Bond Price ($)': prices_for_ytm_range
-        }).dropna() # Drop any rows where price calculation failed
-
-        if not df_price_sensitivity.empty:
-            fig = px.line(df_price_sensitivity,
-                          x='YTM (%)',
-                          y='Bond Price ($)',
-                          title='Bond Price vs. Yield to Maturity',
-                          labels={'YTM (%)': 'Yield to Maturity (%)', 'Bond Price ($)': 'Bond Price ($)'},
-                          markers=True) # Add markers for clarity
-
-            # Highlight the current YTM and its corresponding price
-            fig.add_trace(go.Scatter(
-                x=[ytm_percent],
-                y=[bond_price],
-                mode='markers',
-                marker=dict(size=12, color='red', symbol='circle'),
-                name='Current YTM & Price'
-            ))
-
-            fig.update_layout(hovermode="x unified",
-                              xaxis_title="Yield to Maturity (%)",
-                              yaxis_title="Bond Price ($)",
-                              legend_title_text='') # Remove legend title if only one main trace
-
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Could not generate YTM sensitivity chart due to invalid inputs across the range.")
+        # Calculate bond prices for the whole YTM range in one compiled call,
+        # reusing the period count resolved for the headline price
+        prices_for_ytm_range = _price_sweep(face_value, coupon_rate, num_periods,
+                                            ytm_range / 100.0, coupon_frequency)
+
+        # Plot the sweep straight from the NumPy arrays.
+        # Plotly is imported here rather than at the top so that first paint of the inputs
+        # and the error paths don't pay its import cost.
+        import plotly.graph_objects as go
+
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=ytm_range,
+            y=prices_for_ytm_range,
+            mode='lines+markers', # Add markers for clarity
+            name='Price'
+        ))
+
+        # Highlight the current YTM and its corresponding price
+        fig.add_trace(go.Scatter(
+            x=[ytm_percent],
+            y=[bond_price],
+            mode='markers',
+            marker=dict(size=12, color='red', symbol='circle'),
+            name='Current YTM & Price'
+        ))
+
+        fig.update_layout(title='Bond Price vs. Yield to Maturity',
+                          hovermode="x unified",
+                          xaxis_title="Yield to Maturity (%)",
+                          yaxis_title="Bond Price ($)",
+                          legend_title_text='') # Remove legend title
+
+        st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("---")
     st.caption("Developed by [Your Name/GitHub Profile] for educational purposes.")
@@ -1,5 +1,11 @@
 import math
+import re
+import sys
+import warnings
 from datetime import datetime, date
+import numpy as np
+
+import bond_core
 
 # --- 1. Bond Pricing Theory Explained ---
 # A bond's price is the present value of its future cash flows.
@@ -41,6 +47,22 @@ def calculate_bond_price(face_value, coupon_rate, maturity_date_str, ytm, coupon
         float: The calculated present value (price) of the bond.
         None: If there's an error in input (e.g., invalid date or past maturity).
     """
+    num_periods = _resolve_periods(maturity_date_str, coupon_frequency_per_year)
+    if num_periods is None:
+        return None
+
+    # Calculate the periodic coupon rate and the periodic yield to maturity
+    # (the discount rate applied to each coupon period)
+    periodic_coupon_rate = coupon_rate / coupon_frequency_per_year
+    periodic_ytm = ytm / coupon_frequency_per_year
+
+    return bond_core.price(float(face_value), float(periodic_coupon_rate), num_periods, float(periodic_ytm))
+
+def _resolve_periods(maturity_date_str, coupon_frequency_per_year):
+    """
+    Validates the maturity date and coupon frequency, and returns the number of
+    coupon periods remaining, or None (after printing the error) if either is invalid.
+    """
     # Input Validation: Date format
     try:
         maturity_date = datetime.strptime(maturity_date_str, '%Y-%m-%d').date()
@@ -67,48 +89,138 @@ def calculate_bond_price(face_value, coupon_rate, maturity_date_str, ytm, coupon
 
     # Calculate the total number of coupon periods remaining
     # Use math.ceil to ensure we count all future payments, even if partial year remains.
-    num_periods = math.ceil(years_to_maturity * coupon_frequency_per_year)
+    return math.ceil(years_to_maturity * coupon_frequency_per_year)
+
+# --- 3. Portfolio and Batch Pricing ---
+# Maturity dates in batch input must be exactly YYYY-MM-DD
+_ISO_DATE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
 
-    # Handle cases where the bond is very close to maturity or already matured (though checked above)
-    if num_periods <= 0:
-        # If the bond matures today or very soon, its price is essentially face value + last coupon
-        # For simplicity, we can just return the face value here for very short maturity.
-        # In real-world, this would involve accrued interest.
-        return face_value
+def price_many(face_values, coupon_rates, maturity_days, ytms, coupon_frequencies):
+    """
+    Prices a portfolio of bonds in one pass over structure-of-arrays inputs.
 
-    # Calculate the periodic coupon payment
-    # This is the amount paid out each time a coupon is due.
-    periodic_coupon_payment = (face_value * coupon_rate) / coupon_frequency_per_year
+    Args:
+        face_values (array-like): Par value of each bond.
+        coupon_rates (array-like): Annual coupon rates as decimals (e.g., 0.05 for 5%).
+        maturity_days (array-like): Whole days from today until each bond matures.
+        ytms (array-like): Annual Yields to Maturity as decimals (e.g., 0.04 for 4%).
+        coupon_frequencies (array-like): Coupon payments per year for each bond.
+    All arguments must have the same length; NumPy arrays and pandas Series are both accepted.
 
-    # Calculate the periodic yield to maturity
-    # This is the discount rate applied to each coupon period.
-    periodic_ytm = ytm / coupon_frequency_per_year
+    Returns:
+        numpy.ndarray: One price per bond. Bonds with a non-positive face value, a past
+                       maturity (negative maturity_days) or a non-positive coupon
+                       frequency are priced as NaN.
+    """
+    face_values = np.asarray(face_values, dtype=np.float64)
+    coupon_rates = np.asarray(coupon_rates, dtype=np.float64)
+    maturity_days = np.asarray(maturity_days, dtype=np.int64)
+    ytms = np.asarray(ytms, dtype=np.float64)
+    coupon_frequencies = np.asarray(coupon_frequencies, dtype=np.int64)
 
-    # Calculate the Present Value (PV) of all future coupon payments (annuity)
-    pv_coupons = 0.0
-    if periodic_ytm == 0:
-        # Special case: if YTM is zero, all future cash flows are worth their nominal value
-        pv_coupons = periodic_coupon_payment * num_periods
-    else:
-        # Standard present value of an ordinary annuity formula
-        pv_coupons = periodic_coupon_payment * ((1 - (1 + periodic_ytm)**(-num_periods)) / periodic_ytm)
+    # Same period count as calculate_bond_price, for every bond at once
+    years_to_maturity = maturity_days / 365.25
+    num_periods = np.ceil(years_to_maturity * coupon_frequencies).astype(np.int64)
 
-    # Calculate the Present Value (PV) of the bond's face value (principal)
-    # This is the single payment received at maturity.
-    pv_face_value = face_value / ((1 + periodic_ytm)**num_periods)
+    # Same validation as the interactive CLI; invalid bonds never reach the kernel
+    valid = (face_values > 0) & (maturity_days >= 0) & (coupon_frequencies > 0)
 
-    # The total bond price is the sum of the present values of all its future cash flows.
-    bond_price = pv_coupons + pv_face_value
+    prices = np.full(face_values.shape[0], np.nan)
+    prices[valid] = bond_core.price_vec(face_values[valid], coupon_rates[valid] / coupon_frequencies[valid],
+                                        num_periods[valid], ytms[valid] / coupon_frequencies[valid])
 
-    return bond_price
+    return prices
 
-# --- 3. Command-Line Interface (CLI) for User Interaction ---
+def price_batch(stream):
+    """
+    Prices every bond in a CSV stream in a single vectorized call.
+
+    Each row holds the same fields the interactive prompts ask for, in the same units:
+        face_value,coupon_rate_percent,maturity_date(YYYY-MM-DD),ytm_percent,coupon_frequency
+    e.g. "1000,5,2030-12-31,4,2" (spaces around the commas are allowed, a header line is not)
+
+    Returns:
+        numpy.ndarray: One price per row. Rows with a non-positive face value, a past
+                       maturity date or a non-positive coupon frequency are priced as NaN.
+
+    Raises:
+        ValueError: If any row is malformed (wrong number of columns, a non-numeric
+                    field, or a maturity date that isn't a real YYYY-MM-DD date).
+    """
+    # Read every field as an untruncated string first, so malformed values are
+    # reported instead of being silently cut short or misparsed
+    with warnings.catch_warnings():
+        # Empty input is fine (nothing to price); don't let loadtxt warn about it
+        warnings.simplefilter("ignore", UserWarning)
+        rows = np.char.strip(np.loadtxt(stream, delimiter=',', dtype=str, ndmin=2))
+    if rows.size == 0:
+        return np.empty(0)
+    if rows.shape[1] != 5:
+        raise ValueError(f"expected 5 columns per row but found {rows.shape[1]}")
+
+    face_values = _numeric_column(rows, 0, "face value", np.float64)
+    coupon_rates = _numeric_column(rows, 1, "coupon rate", np.float64) / 100.0
+    ytms = _numeric_column(rows, 3, "yield to maturity", np.float64) / 100.0
+    coupon_frequencies = _numeric_column(rows, 4, "coupon frequency", np.int64)
+
+    for maturity_date_str in rows[:, 2]:
+        if not _ISO_DATE.fullmatch(maturity_date_str):
+            raise ValueError(f"invalid maturity date '{maturity_date_str}', expected YYYY-MM-DD")
+
+    # Date arithmetic for the whole batch in a few array operations,
+    # instead of one datetime subtraction per bond
+    maturity_dates = np.array(rows[:, 2], dtype='datetime64[D]')
+    today_np = np.datetime64(date.today(), 'D')
+    days_to_maturity = (maturity_dates - today_np).astype('timedelta64[D]').astype(np.int64)
+
+    prices = price_many(face_values, coupon_rates, days_to_maturity, ytms, coupon_frequencies)
+
+    num_invalid = int(np.isnan(prices).sum())
+    if num_invalid:
+        print(f"Warning: {num_invalid} row(s) had a non-positive face value, a past maturity date "
+              "or a non-positive coupon frequency and were priced as nan.", file=sys.stderr)
+
+    return prices
+
+def _numeric_column(rows, index, name, dtype):
+    """
+    Converts one column of batch input to numbers, naming the offending value if one isn't valid.
+    """
+    column = rows[:, index]
+    try:
+        return column.astype(dtype)
+    except ValueError:
+        # Only reached on bad input: find the first value that doesn't convert, for the message
+        for value in column:
+            try:
+                np.array(value).astype(dtype)
+            except ValueError:
+                raise ValueError(f"invalid {name} '{value}'") from None
+        raise
+
+# --- 4. Command-Line Interface (CLI) for User Interaction ---
 def main():
     """
     This function provides an interactive command-line interface
     for the bond pricing calculator. It prompts the user for inputs
     and displays the calculated bond price.
+
+    When input is piped in rather than typed (e.g. `python bond_pricer.py < bonds.csv`),
+    every row is priced in batch (see price_batch) and the prices are written to stdout,
+    one per line. Note this means answers to the prompts can no longer be piped in one
+    per line (e.g. `printf "1000\\n5\\n..." | python bond_pricer.py`); pipe CSV rows instead.
     """
+    if not sys.stdin.isatty():
+        try:
+            prices = price_batch(sys.stdin)
+        except ValueError as e:
+            print(f"Error: Invalid batch input ({e}).", file=sys.stderr)
+            print("Each line must be: face_value,coupon_rate_percent,YYYY-MM-DD,ytm_percent,coupon_frequency "
+                  "(e.g. 1000,5,2030-12-31,4,2).", file=sys.stderr)
+            sys.exit(1)
+        np.savetxt(sys.stdout, prices, fmt='%.2f')
+        return
+
     print("\n" + "="*40)
     print("      Simple Bond Price Calculator")
     print("="*40 + "\n")
@@ -0,0 +1,45 @@
+import numpy as np
+
+import bond_core
+import bond_pricer
+
+# --- Opt-in Vectorized calculate_bond_price ---
+# Importing this module rebinds bond_pricer.calculate_bond_price so that `ytm` may be
+# either a single yield (unchanged behaviour) or an array of yields. Arrays are priced
+# in one call by bond_core.price_numpy, using plain NumPy array operations, so sweeps
+# stay vectorized even where Numba isn't installed. That helper uses the closed-form
+# annuity, so array prices can differ from scalar ones in the last few digits.
+#
+# This only affects CLI and library callers of bond_pricer.calculate_bond_price.
+# The Streamlit dashboard (bond_dashboard.py) has its own pricer and doesn't need it:
+# its sensitivity sweep falls back to bond_core.price_numpy by itself without Numba.
+#
+# Opt in by importing it once, before calculate_bond_price is imported by name anywhere else:
+#
+#   import bond_pricer_vectorized
+#   from bond_pricer import calculate_bond_price
+#   prices = calculate_bond_price(1000, 0.05, "2030-12-31", np.linspace(0.01, 0.10, 50), 2)
+
+_scalar_calculate_bond_price = bond_pricer.calculate_bond_price
+
+def calculate_bond_price(face_value, coupon_rate, maturity_date_str, ytm, coupon_frequency_per_year=2):
+    """
+    Drop-in replacement for bond_pricer.calculate_bond_price that also accepts an array of YTMs.
+
+    Returns:
+        float: The bond price, if ytm is a scalar.
+        numpy.ndarray: One price per yield, if ytm is an array.
+        None: If there's an error in input (e.g., invalid date or past maturity).
+    """
+    if np.isscalar(ytm):
+        return _scalar_calculate_bond_price(face_value, coupon_rate, maturity_date_str, ytm,
+                                            coupon_frequency_per_year)
+
+    num_periods = bond_pricer._resolve_periods(maturity_date_str, coupon_frequency_per_year)
+    if num_periods is None:
+        return None
+
+    return bond_core.price_numpy(face_value, coupon_rate / coupon_frequency_per_year, num_periods,
+                                 np.asarray(ytm, dtype=np.float64) / coupon_frequency_per_year)
+
+bond_pricer.calculate_bond_price = calculate_bond_price
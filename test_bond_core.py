@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+import bond_core
+
+# The dashboard's sensitivity chart prices in float32 (bond_core.price_f32).
+# Its error against the float64 pricer (bond_core.price) must stay below 1e-5 relative
+# to the price. Prices that underflow towards zero (e.g. a zero-coupon bond at a very
+# high yield over a long horizon) are instead held to 1e-6 of face value.
+RELATIVE_TOLERANCE = 1e-5
+FACE_VALUE_TOLERANCE = 1e-6
+
+@pytest.mark.parametrize("coupon_frequency", [1, 2, 4, 12]) # The sidebar's frequency options
+@pytest.mark.parametrize("face_value", [1.0, 1000.0, 12345.67, 1e6])
+@pytest.mark.parametrize("coupon_rate", [0.0, 0.05, 0.15, 1.0])
+def test_price_f32_matches_float64_price(coupon_frequency, face_value, coupon_rate):
+    # Same yield grid as the sidebar allows (0-100%) plus the chart's +5% margin
+    ytms = np.round(np.linspace(0.0, 105.0, 211), 1) / 100.0
+
+    for years in (0, 1, 5, 10, 30, 50, 100):
+        num_periods = years * coupon_frequency
+        expected = np.array([bond_core.price(face_value, coupon_rate / coupon_frequency,
+                                             num_periods, ytm / coupon_frequency) for ytm in ytms])
+        actual = np.array([bond_core.price_f32(face_value, coupon_rate / coupon_frequency, num_periods,
+                                               np.float32(ytm) / np.float32(coupon_frequency))
+                           for ytm in ytms], dtype=np.float64)
+
+        np.testing.assert_allclose(actual, expected, rtol=RELATIVE_TOLERANCE,
+                                   atol=FACE_VALUE_TOLERANCE * face_value,
+                                   err_msg=f"{years} years to maturity")
+
+def test_price_f32_prices_at_face_value_when_matured():
+    assert bond_core.price_f32(1000.0, 0.025, 0, np.float32(0.02)) == pytest.approx(1000.0)
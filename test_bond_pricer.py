@@ -0,0 +1,42 @@
+import io
+
+import numpy as np
+import pytest
+
+import bond_pricer
+
+def test_price_batch_prices_valid_row():
+    prices = bond_pricer.price_batch(io.StringIO("1000,5,2099-12-31,5,2\n"))
+
+    expected = bond_pricer.calculate_bond_price(1000, 0.05, "2099-12-31", 0.05, 2)
+    assert prices.shape == (1,)
+    assert prices[0] == pytest.approx(expected)
+
+def test_price_batch_allows_spaces_around_commas():
+    prices = bond_pricer.price_batch(io.StringIO("1000, 5, 2099-12-31 , 5, 2\n"))
+
+    assert prices[0] == pytest.approx(bond_pricer.calculate_bond_price(1000, 0.05, "2099-12-31", 0.05, 2))
+
+def test_price_batch_prices_past_maturity_as_nan():
+    prices = bond_pricer.price_batch(io.StringIO("1000,5,2099-12-31,5,2\n1000,5,2000-01-01,5,2\n"))
+
+    assert not np.isnan(prices[0])
+    assert np.isnan(prices[1])
+
+def test_price_batch_prices_non_positive_face_value_as_nan():
+    prices = bond_pricer.price_batch(io.StringIO("0,5,2099-12-31,5,2\n-1000,5,2099-12-31,5,2\n"))
+
+    assert np.isnan(prices).all()
+
+@pytest.mark.parametrize("batch_input", [
+    "face_value,coupon_rate,maturity_date,ytm,coupon_frequency\n1000,5,2099-12-31,5,2\n", # Header line
+    "1000,5,2099-12-3199,5,2\n", # Over-long date, must not be truncated to 2099-12-31
+    "1000,5,2099-13-31,5,2\n", # Not a real date
+    "1000,5,2099-12,5,2\n", # Not YYYY-MM-DD
+    "1000,5,2099-12-31,5\n", # Too few columns
+    "1000,5,2099-12-31,5,2,1\n", # Too many columns
+    "1000,5,2099-12-31,5,2\n1000,5,2099-12-31,5\n", # Inconsistent column count
+])
+def test_price_batch_rejects_malformed_input(batch_input):
+    with pytest.raises(ValueError):
+        bond_pricer.price_batch(io.StringIO(batch_input))